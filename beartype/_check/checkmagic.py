@@ -71,6 +71,17 @@ decorator requiring one or more types or tuples of types cached by this
 singleton).
 '''
 
+
+ARG_NAME_UNPASSED = '__beartype_unpassed'
+'''
+Name of the **private unpassed parameter sentinel** (i.e.,
+:mod:`beartype`-specific parameter whose default value is the private
+:data:`beartype._util.utilobject.SENTINEL` object *never* passed by sane
+callers, passed to each wrapper function generated by the :func:`beartype.beartype` decorator localizing one or
+more optional parameters possibly passed by keyword).
+'''
+
+
 # ....................{ NAMES ~ locals                     }....................
 VAR_NAME_ARGS_LEN = '__beartype_args_len'
 '''
@@ -82,7 +93,7 @@ number of positional arguments passed to the current call).
 VAR_NAME_RANDOM_INT = '__beartype_random_int'
 '''
 Name of the local variable providing a **pseudo-random integer** (i.e.,
-unsigned 32-bit integer pseudo-randomly generated for subsequent use in
+unsigned 30-bit integer pseudo-randomly generated for subsequent use in
 type-checking randomly indexed container items by the current call).
 '''
 
@@ -9,6 +9,28 @@ pure-Python string constants formatted and concatenated together to dynamically
 generate boolean expressions type-checking arbitrary objects against arbitrary
 PEP-compliant type hints).
 
+Snippets interpolated exactly once (i.e., *not* deferring the interpolation of
+an ``{indent_curr}`` format variable) are instead implemented as trivial
+functions returning f-strings, which CPython compiles into efficient
+``FORMAT_VALUE`` and ``BUILD_STRING`` opcodes rather than reparsing with the
+comparatively slow :meth:`str.format` method on each call.
+
+Snippets are intentionally :class:`str` rather than :class:`bytes` objects.
+Although the latter support ``%``-style interpolation, profiling under CPython
+3.11 shows f-strings to be roughly twice as fast as :meth:`bytes.__mod__` and
+:meth:`str.join` to be faster than :meth:`bytes.join`. Since CPython already
+stores ASCII strings with one byte per character (:pep:`393`), :class:`bytes`
+snippets would also reduce *no* space while requiring all interpolated names
+and representations to be encoded and the resulting code to be decoded.
+
+Snippets are also intentionally *not* interned via :func:`sys.intern`. Each
+snippet is already a module-scoped singleton shared by all generated code, and
+both :meth:`str.format` and :meth:`str.join` copy the characters of these
+snippets into new strings rather than referencing them. Interning would thus
+share *no* storage between the generated code of different wrappers. The
+identifiers embedded in that code (e.g., hidden ``__beartype_``-prefixed
+parameter names) are already interned by the :func:`compile` builtin.
+
 This private submodule is *not* intended for importation by downstream callers.
 '''
 
@@ -18,13 +40,66 @@ from beartype._check.checkmagic import (
 )
 
 # ....................{ PITH                               }....................
-PEP_CODE_PITH_ASSIGN_EXPR = '''{pith_curr_var_name} := {pith_curr_expr}'''
-'''
-Python >= 3.8-specific assignment expression assigning the full Python
-expression yielding the value of the current pith to a unique local variable,
-enabling PEP-compliant child hints to obtain this pith via this efficient
-variable rather than via this inefficient full Python expression.
-'''
+def make_pith_assign_expr(pith_curr_var_name: str, pith_curr_expr: str) -> str:
+    '''
+    Python >= 3.8-specific assignment expression assigning the full Python
+    expression yielding the value of the current pith to a unique local
+    variable, enabling PEP-compliant child hints to obtain this pith via this
+    efficient variable rather than via this inefficient full Python expression.
+
+    Parameters
+    ----------
+    pith_curr_var_name : str
+        Name of the local variable to assign the current pith to.
+    pith_curr_expr : str
+        Full Python expression yielding the value of the current pith.
+
+    Returns
+    ----------
+    str
+        Assignment expression assigning this expression to this variable.
+    '''
+
+    return f'{pith_curr_var_name} := {pith_curr_expr}'
+
+# ....................{ JOINERS                            }....................
+def join_code_parts(
+    code_parts: list, code_suffix: str, line_rstrip_index: int) -> str:
+    '''
+    Python code snippet joined from the passed list of substrings, stripping
+    the erroneous boolean operator suffixing the last such substring (appended
+    by the last child hint) *before* suffixing that snippet by the passed
+    substring.
+
+    Appending substrings to a list and then joining that list into a string
+    exactly once avoids the quadratic cost of repeated string concatenation.
+
+    Parameters
+    ----------
+    code_parts : list
+        List of all substrings of this snippet, which this function modifies
+        in-place.
+    code_suffix : str
+        Substring suffixing this snippet.
+    line_rstrip_index : int
+        Negative index required to strip the erroneous boolean operator
+        suffixing the last such substring (e.g.,
+        :data:`beartype._util.text.utiltextmagic.LINE_RSTRIP_INDEX_AND`).
+
+    Returns
+    ----------
+    str
+        Python code snippet joined from these substrings.
+    '''
+
+    # Strip the erroneous boolean operator suffixing the last substring.
+    code_parts[-1] = code_parts[-1][:line_rstrip_index]
+
+    # Suffix this snippet by this substring.
+    code_parts.append(code_suffix)
+
+    # Join these substrings into this snippet.
+    return ''.join(code_parts)
 
 # ....................{ HINT ~ placeholder : child         }....................
 PEP_CODE_HINT_CHILD_PLACEHOLDER_PREFIX = '@['
@@ -158,12 +233,47 @@ based on ternary conditional (albeit slightly less intuitive).
 '''
 
 
-PEP484585_CODE_HINT_SEQUENCE_ARGS_1_PITH_CHILD_EXPR = (
-    f'''{{pith_curr_var_name}}[{VAR_NAME_RANDOM_INT} % len({{pith_curr_var_name}})]''')
-'''
-PEP-compliant Python expression yielding the value of a randomly indexed item
-of the current pith (which, by definition, *must* be a standard sequence).
-'''
+def make_sequence_args_1_pith_child_expr(pith_curr_var_name: str) -> str:
+    '''
+    PEP-compliant Python expression yielding the value of a randomly indexed
+    item of the current pith (which, by definition, *must* be a standard
+    sequence).
+
+    Parameters
+    ----------
+    pith_curr_var_name : str
+        Name of the local variable yielding the current pith.
+
+    Returns
+    ----------
+    str
+        Python expression yielding a randomly indexed item of this pith.
+
+    Caveats
+    ----------
+    **This expression intentionally reduces the random integer into the range
+    of valid indices via the modulo operator** rather than either:
+
+    * Caching the length of this pith in yet another local variable. This
+      expression is only ever evaluated once per type-check of this pith,
+      where this pith is already efficiently accessed via the local variable
+      assigned by the prior assignment expression. Caching that length would
+      thus only add one more store and load for *no* reduction in calls to the
+      :func:`len` builtin.
+    * Lemire's multiply-shift reduction (e.g.,
+      ``{pith}[{random_int} * len({pith}) >> 30]``). Although the latter
+      avoids a hardware division in compiled languages, CPython implements
+      both as arbitrary-precision integer operations. Since the product of a
+      30-bit random integer and a length typically exceeds a single machine
+      digit, that reduction is roughly twice as slow as the modulo under
+      CPython in practice. The modulo bias (at most ``len({pith}) / 2**30``)
+      is negligible for type-checking purposes.
+    '''
+
+    return (
+        f'{pith_curr_var_name}[{VAR_NAME_RANDOM_INT} % '
+        f'len({pith_curr_var_name})]'
+    )
 
 # ....................{ HINT ~ pep : (484|585) : tuple     }....................
 PEP484585_CODE_HINT_TUPLE_FIXED_PREFIX = '''(
@@ -238,12 +348,26 @@ this parent type has been generated.
 '''
 
 
-PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR = (
-    '''{pith_curr_var_name}[{pith_child_index}]''')
-'''
-PEP-compliant Python expression yielding the value of the currently indexed
-item of the current pith (which, by definition, *must* be a tuple).
-'''
+def make_tuple_fixed_nonempty_pith_child_expr(
+    pith_curr_var_name: str, pith_child_index: int) -> str:
+    '''
+    PEP-compliant Python expression yielding the value of the currently indexed
+    item of the current pith (which, by definition, *must* be a tuple).
+
+    Parameters
+    ----------
+    pith_curr_var_name : str
+        Name of the local variable yielding the current pith.
+    pith_child_index : int
+        0-based index of the currently indexed item of this pith.
+
+    Returns
+    ----------
+    str
+        Python expression yielding the currently indexed item of this pith.
+    '''
+
+    return f'{pith_curr_var_name}[{pith_child_index}]'
 
 # ....................{ HINT ~ pep : (484|585) : subclass  }....................
 PEP484585_CODE_HINT_SUBCLASS = '''(
@@ -259,13 +383,26 @@ type hint** (e.g., :attr:`typing.Type`, :class:`type`).
 '''
 
 # ....................{ HINT ~ pep : 484 : instance        }....................
-PEP484_CODE_HINT_INSTANCE = (
-    '''isinstance({pith_curr_expr}, {hint_curr_expr})''')
-'''
-PEP-compliant code snippet type-checking the current pith against the
-current child PEP-compliant type expected to be a trivial non-:mod:`typing`
-type (e.g., :class:`int`, :class:`str`).
-'''
+def make_instance_expr(pith_curr_expr: str, hint_curr_expr: str) -> str:
+    '''
+    PEP-compliant code snippet type-checking the current pith against the
+    current child PEP-compliant type expected to be a trivial
+    non-:mod:`typing` type (e.g., :class:`int`, :class:`str`).
+
+    Parameters
+    ----------
+    pith_curr_expr : str
+        Python expression yielding the value of the current pith.
+    hint_curr_expr : str
+        Python expression yielding this type.
+
+    Returns
+    ----------
+    str
+        Python expression type-checking this pith against this type.
+    '''
+
+    return f'isinstance({pith_curr_expr}, {hint_curr_expr})'
 
 # ....................{ HINT ~ pep : 484 : union           }....................
 PEP484_CODE_HINT_UNION_PREFIX = '''('''
@@ -318,6 +455,28 @@ See Also
     Further details.
 '''
 
+PEP484_CODE_HINT_UNION_CHILD_NONE = '''
+{{indent_curr}}    # True only if this pith is "None".
+{{indent_curr}}    ({pith_curr_expr}) is None or'''
+'''
+PEP-compliant code snippet type-checking the current pith against the
+:data:`None` singleton subscripting a parent :class:`typing.Union` type hint
+(e.g., ``typing.Optional[int]``).
+
+This snippet is a microoptimization of the more general
+:data:`PEP484_CODE_HINT_UNION_CHILD_NONPEP` snippet. Since :data:`None` is a
+singleton, an ``is`` test compiles to a single ``IS_OP`` bytecode and is thus
+faster than passing the type of :data:`None` to the :func:`isinstance` builtin.
+
+The current pith expression is intentionally parenthesized, as that expression
+is typically an assignment expression binding more loosely than ``is``.
+
+See Also
+----------
+:data:`PEP484_CODE_HINT_UNION_CHILD_PEP`
+    Further details.
+'''
+
 # ....................{ HINT ~ pep : 586                   }....................
 PEP586_CODE_HINT_PREFIX = '''(
 {{indent_curr}}    # True only if this pith is of one of these literal types.
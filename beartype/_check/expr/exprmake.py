@@ -22,7 +22,10 @@ from beartype.roar import (
     BeartypeDecorHintPep593Exception,
 )
 from beartype.typing import Optional
-from beartype._cave._cavefast import TestableTypes
+from beartype._cave._cavefast import (
+    NoneType,
+    TestableTypes,
+)
 from beartype._check.checkmagic import (
     ARG_NAME_GETRANDBITS,
     VAR_NAME_PREFIX_PITH,
@@ -46,20 +49,17 @@ from beartype._check.expr._exprscope import (
 from beartype._check.expr._exprsnip import (
     PEP_CODE_HINT_CHILD_PLACEHOLDER_PREFIX,
     PEP_CODE_HINT_CHILD_PLACEHOLDER_SUFFIX,
-    PEP_CODE_PITH_ASSIGN_EXPR,
     PEP484585_CODE_HINT_GENERIC_CHILD,
     PEP484585_CODE_HINT_GENERIC_PREFIX,
     PEP484585_CODE_HINT_GENERIC_SUFFIX,
     PEP484585_CODE_HINT_SEQUENCE_ARGS_1,
-    PEP484585_CODE_HINT_SEQUENCE_ARGS_1_PITH_CHILD_EXPR,
     PEP484585_CODE_HINT_SUBCLASS,
     PEP484585_CODE_HINT_TUPLE_FIXED_EMPTY,
     PEP484585_CODE_HINT_TUPLE_FIXED_LEN,
     PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_CHILD,
-    PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR,
     PEP484585_CODE_HINT_TUPLE_FIXED_PREFIX,
     PEP484585_CODE_HINT_TUPLE_FIXED_SUFFIX,
-    PEP484_CODE_HINT_INSTANCE,
+    PEP484_CODE_HINT_UNION_CHILD_NONE,
     PEP484_CODE_HINT_UNION_CHILD_PEP,
     PEP484_CODE_HINT_UNION_CHILD_NONPEP,
     PEP484_CODE_HINT_UNION_PREFIX,
@@ -70,6 +70,11 @@ from beartype._check.expr._exprsnip import (
     PEP593_CODE_HINT_VALIDATOR_CHILD,
     PEP593_CODE_HINT_VALIDATOR_PREFIX,
     PEP593_CODE_HINT_VALIDATOR_SUFFIX,
+    join_code_parts,
+    make_instance_expr,
+    make_pith_assign_expr,
+    make_sequence_args_1_pith_child_expr,
+    make_tuple_fixed_nonempty_pith_child_expr,
 )
 from beartype._conf.confcls import BeartypeConf
 from beartype._data.datatyping import CodeGenerated
@@ -180,18 +185,31 @@ def make_check_expr(
     _LINE_RSTRIP_INDEX_AND=LINE_RSTRIP_INDEX_AND,
     _LINE_RSTRIP_INDEX_OR=LINE_RSTRIP_INDEX_OR,
 
+    # "beartype._check.expr._exprsnip" snippet functions.
+    _join_code_parts: Callable = join_code_parts,
+    _make_instance_expr: Callable = make_instance_expr,
+    _make_pith_assign_expr: Callable = make_pith_assign_expr,
+    _make_sequence_args_1_pith_child_expr: Callable = (
+        make_sequence_args_1_pith_child_expr),
+    _make_tuple_fixed_nonempty_pith_child_expr: Callable = (
+        make_tuple_fixed_nonempty_pith_child_expr),
+
     # "beartype._check.expr._exprsnip" string globals required only for
     # their bound str.format() methods.
-    PEP_CODE_PITH_ASSIGN_EXPR_format: Callable = (
-        PEP_CODE_PITH_ASSIGN_EXPR.format),
-    PEP484_CODE_HINT_INSTANCE_format: Callable = (
-        PEP484_CODE_HINT_INSTANCE.format),
+    #
+    # Note that these bound methods are intentionally passed individually
+    # rather than registered with a single dictionary dispatched by snippet
+    # name (e.g., "emit('union_child_pep', ...)"). While the latter would
+    # centralize snippet formatting, each call would then incur an additional
+    # dictionary lookup *AND* an additional Python-level function call
+    # forwarding keyword arguments -- slower than calling each bound method
+    # directly from a local variable, as below. Since these bound methods are
+    # all declared here, this signature is already the single location to
+    # swap in alternate formatters.
     PEP484585_CODE_HINT_GENERIC_CHILD_format: Callable = (
         PEP484585_CODE_HINT_GENERIC_CHILD.format),
     PEP484585_CODE_HINT_SEQUENCE_ARGS_1_format: Callable = (
         PEP484585_CODE_HINT_SEQUENCE_ARGS_1.format),
-    PEP484585_CODE_HINT_SEQUENCE_ARGS_1_PITH_CHILD_EXPR_format: Callable = (
-        PEP484585_CODE_HINT_SEQUENCE_ARGS_1_PITH_CHILD_EXPR.format),
     PEP484585_CODE_HINT_SUBCLASS_format: Callable = (
         PEP484585_CODE_HINT_SUBCLASS.format),
     PEP484585_CODE_HINT_TUPLE_FIXED_EMPTY_format: Callable = (
@@ -200,8 +218,8 @@ def make_check_expr(
         PEP484585_CODE_HINT_TUPLE_FIXED_LEN.format),
     PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_CHILD_format: Callable = (
         PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_CHILD.format),
-    PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR_format: Callable = (
-        PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR.format),
+    PEP484_CODE_HINT_UNION_CHILD_NONE_format: Callable = (
+        PEP484_CODE_HINT_UNION_CHILD_NONE.format),
     PEP484_CODE_HINT_UNION_CHILD_PEP_format: Callable = (
         PEP484_CODE_HINT_UNION_CHILD_PEP.format),
     PEP484_CODE_HINT_UNION_CHILD_NONPEP_format: Callable = (
@@ -788,10 +806,10 @@ def make_check_expr(
             # pith as an instance of the origin type originating this sign
             # (e.g., "list" for the hint "typing.List[int]").
                 # Code type-checking the current pith against this origin type.
-                func_curr_code = PEP484_CODE_HINT_INSTANCE_format(
-                    pith_curr_expr=pith_curr_expr,
+                func_curr_code = _make_instance_expr(
+                    pith_curr_expr,
                     # Python expression evaluating to this origin type.
-                    hint_curr_expr=add_func_scope_type(
+                    add_func_scope_type(
                         # Origin type of this hint if any *OR* raise an
                         # exception -- which should *NEVER* happen, as this
                         # hint was validated above to be supported.
@@ -827,10 +845,8 @@ def make_check_expr(
                     ))
 
                 # Code type-checking the current pith against this class.
-                func_curr_code = PEP484_CODE_HINT_INSTANCE_format(
-                    pith_curr_expr=pith_curr_expr,
-                    hint_curr_expr=hint_curr_expr,
-                )
+                func_curr_code = _make_instance_expr(
+                    pith_curr_expr, hint_curr_expr)
             # Else, this hint is *NOT* a forward reference.
             #
             # Since this hint is *NOT* shallowly type-checkable, this hint
@@ -1049,11 +1065,8 @@ def make_check_expr(
 
                         # Python >= 3.8-specific assignment expression
                         # assigning this full expression to this variable.
-                        pith_curr_assign_expr = (
-                            PEP_CODE_PITH_ASSIGN_EXPR_format(
-                                pith_curr_var_name=pith_curr_var_name,
-                                pith_curr_expr=pith_curr_expr,
-                            ))
+                        pith_curr_assign_expr = _make_pith_assign_expr(
+                            pith_curr_var_name, pith_curr_expr)
                     # Else, one or more of the above conditions have *NOT* been
                     # satisfied. In this case, preserve the Python code snippet
                     # evaluating to the current pith as is.
@@ -1155,10 +1168,34 @@ def make_check_expr(
                         else:
                             hint_childs_nonpep.add(hint_child)
 
-                    # Initialize the code type-checking the current pith
-                    # against these arguments to the substring prefixing all
-                    # such code.
-                    func_curr_code = PEP484_CODE_HINT_UNION_PREFIX
+                    # Initialize the list of all substrings of the code
+                    # type-checking the current pith against these arguments to
+                    # the substring prefixing all such code. Appending to this
+                    # list and then joining this list into a string exactly
+                    # once avoids quadratic string concatenation.
+                    func_curr_code_parts = [PEP484_CODE_HINT_UNION_PREFIX]
+
+                    # True only if this union is subscripted by the "None"
+                    # singleton (e.g., "typing.Optional[int]").
+                    is_hint_child_none = NoneType in hint_childs_nonpep
+
+                    # If this union is subscripted by the "None" singleton,
+                    # generate and append code type-checking the current pith
+                    # to be "None" via an efficient identity test *BEFORE* any
+                    # other child hints subscripting this union. Since
+                    # "typing.Optional[...]" is a union of "None" and one or
+                    # more child hints, this is the most common union by far.
+                    # This test is faster than the isinstance() builtin.
+                    #
+                    # Note that this union is guaranteed to be subscripted by
+                    # one or more child hints other than "None". Ergo, prefer
+                    # the expression assigning the value of the current pith
+                    # to a local variable efficiently reused below.
+                    if is_hint_child_none:
+                        hint_childs_nonpep.remove(NoneType)
+                        func_curr_code_parts.append(
+                            PEP484_CODE_HINT_UNION_CHILD_NONE_format(
+                                pith_curr_expr=pith_curr_assign_expr))
 
                     # If this union is subscripted by one or more
                     # PEP-noncompliant child hints, generate and append
@@ -1166,13 +1203,18 @@ def make_check_expr(
                     # less efficient code type-checking any PEP-compliant child
                     # hints subscripting this union.
                     if hint_childs_nonpep:
-                        func_curr_code += (
+                        func_curr_code_parts.append(
                             PEP484_CODE_HINT_UNION_CHILD_NONPEP_format(
                                 # Python expression yielding the value of the
                                 # current pith. Specifically...
                                 pith_curr_expr=(
-                                    # If this union is subscripted by one or
-                                    # more PEP-compliant child hints, prefer
+                                    # If the above conditional already assigned
+                                    # this value to a local variable, prefer
+                                    # that variable.
+                                    pith_curr_var_name
+                                    if is_hint_child_none else
+                                    # Else, if this union is subscripted by one
+                                    # or more PEP-compliant child hints, prefer
                                     # the expression assigning this value to a
                                     # local variable efficiently reused by
                                     # subsequent code generated for
@@ -1222,7 +1264,7 @@ def make_check_expr(
                     # and append code type-checking this child hint.
                     for hint_child_index, hint_child in enumerate(
                         hint_childs_pep):
-                        func_curr_code += (
+                        func_curr_code_parts.append(
                             PEP484_CODE_HINT_UNION_CHILD_PEP_format(
                                 # Python expression yielding the value of the
                                 # current pith.
@@ -1236,6 +1278,8 @@ def make_check_expr(
                                     # current conditional.
                                     pith_curr_var_name
                                     if (
+                                        # The "None" singleton *OR*...
+                                        is_hint_child_none or
                                         # One or more PEP-noncompliant child
                                         # hints *OR*...
                                         hint_childs_nonpep or
@@ -1262,25 +1306,25 @@ def make_check_expr(
                                     pith_curr_assign_expr
                                 )))
 
-                    # If this code is *NOT* its initial value, this union is
-                    # subscripted by one or more unignorable child hints and
-                    # the above logic generated code type-checking these child
-                    # hints. In this case...
-                    if func_curr_code is not (
-                        PEP484_CODE_HINT_UNION_PREFIX):
-                        # Munge this code to...
-                        func_curr_code = (
-                            # Strip the erroneous " or" suffix appended by the
-                            # last child hint from this code.
-                            f'{func_curr_code[:_LINE_RSTRIP_INDEX_OR]}'
-                            # Suffix this code by the substring suffixing all
-                            # such code.
-                            f'{PEP484_CODE_HINT_UNION_SUFFIX}'
-                        # Format the "indent_curr" prefix into this code
-                            # deferred above for efficiency.
+                    # If this list contains more than its initial substring,
+                    # this union is subscripted by one or more unignorable
+                    # child hints and the above logic generated code
+                    # type-checking these child hints. In this case...
+                    if len(func_curr_code_parts) > 1:
+                        # Join these substrings into this code suffixed by
+                        # the substring suffixing all such code (stripping the
+                        # erroneous " or" suffix appended by the last child
+                        # hint) and format the "indent_curr" prefix into this
+                        # code deferred above for efficiency.
+                        func_curr_code = _join_code_parts(
+                            func_curr_code_parts,
+                            PEP484_CODE_HINT_UNION_SUFFIX,
+                            _LINE_RSTRIP_INDEX_OR,
                         ).format(indent_curr=indent_curr)
-                    # Else, this snippet is its initial value and thus
-                    # ignorable.
+                    # Else, this list contains only its initial substring and
+                    # is thus ignorable.
+                    else:
+                        func_curr_code = PEP484_CODE_HINT_UNION_PREFIX
 
                     # Release this pair of sets back to their respective pools.
                     release_object_typed(hint_childs_nonpep)
@@ -1358,20 +1402,16 @@ def make_check_expr(
                                     # randomly indexed item of the current pith
                                     # (i.e., standard sequence) to be
                                     # type-checked against this child hint.
-                                    PEP484585_CODE_HINT_SEQUENCE_ARGS_1_PITH_CHILD_EXPR_format(
-                                        pith_curr_var_name=(
-                                            pith_curr_var_name))),
+                                    _make_sequence_args_1_pith_child_expr(
+                                        pith_curr_var_name)),
                             ))
                     # Else, this child hint is ignorable. In this case,
                     # fallback to generating trivial code shallowly
                     # type-checking the current pith as an instance of this
                     # origin type.
                     else:
-                        func_curr_code = (
-                            PEP484_CODE_HINT_INSTANCE_format(
-                                pith_curr_expr=pith_curr_expr,
-                                hint_curr_expr=hint_curr_expr,
-                            ))
+                        func_curr_code = _make_instance_expr(
+                            pith_curr_expr, hint_curr_expr)
                 # Else, this hint is neither a standard sequence *NOR* variadic
                 # tuple.
                 #
@@ -1418,15 +1458,17 @@ def make_check_expr(
                     ), (f'{_EXCEPTION_PREFIX}variadic tuple type hint '
                         f'{repr(hint_curr)} unhandled.')
 
-                    # Initialize the code type-checking this pith against this
-                    # tuple to the substring prefixing all such code.
-                    func_curr_code = PEP484585_CODE_HINT_TUPLE_FIXED_PREFIX
+                    # Initialize the list of all substrings of the code
+                    # type-checking this pith against this tuple to the
+                    # substring prefixing all such code.
+                    func_curr_code_parts = [
+                        PEP484585_CODE_HINT_TUPLE_FIXED_PREFIX]
 
                     # If this hint is the empty fixed-length tuple, generate
                     # and append code type-checking the current pith to be the
                     # empty tuple. This edge case constitutes a code smell.
                     if is_hint_pep484585_tuple_empty(hint_curr):
-                        func_curr_code += (
+                        func_curr_code_parts.append(
                             PEP484585_CODE_HINT_TUPLE_FIXED_EMPTY_format(
                                 pith_curr_var_name=(
                                     pith_curr_var_name),
@@ -1435,7 +1477,7 @@ def make_check_expr(
                     # case...
                     else:
                         # Append code type-checking the length of this pith.
-                        func_curr_code += (
+                        func_curr_code_parts.append(
                             PEP484585_CODE_HINT_TUPLE_FIXED_LEN_format(
                                 pith_curr_var_name=(
                                     pith_curr_var_name),
@@ -1451,30 +1493,29 @@ def make_check_expr(
                                 continue
                             # Else, this child hint is unignorable.
 
-                            # Append code type-checking this child pith.
-                            func_curr_code += PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_CHILD_format(
-                                hint_child_placeholder=_enqueue_hint_child(
-                                    # Python expression yielding the value of
-                                    # the currently indexed item of this tuple
-                                    # to be type-checked against this child
-                                    # hint.
-                                    PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_PITH_CHILD_EXPR_format(
-                                        pith_curr_var_name=(
-                                            pith_curr_var_name),
-                                        pith_child_index=hint_child_index,
-                                    )
-                                ),
-                            )
+                            # Placeholder substring to be replaced by code
+                            # type-checking this child pith.
+                            hint_child_placeholder = _enqueue_hint_child(
+                                # Python expression yielding the value of the
+                                # currently indexed item of this tuple to be
+                                # type-checked against this child hint.
+                                _make_tuple_fixed_nonempty_pith_child_expr(
+                                    pith_curr_var_name, hint_child_index))
 
-                    # Munge this code to...
-                    func_curr_code = (
-                        # Strip the erroneous " and" suffix appended by the
-                        # last child hint from this code.
-                        f'{func_curr_code[:_LINE_RSTRIP_INDEX_AND]}'
-                        # Suffix this code by the substring suffixing all such
-                        # code.
-                        f'{PEP484585_CODE_HINT_TUPLE_FIXED_SUFFIX}'
-                    # Format...
+                            # Append code type-checking this child pith.
+                            func_curr_code_parts.append(
+                                PEP484585_CODE_HINT_TUPLE_FIXED_NONEMPTY_CHILD_format(
+                                    hint_child_placeholder=(
+                                        hint_child_placeholder)))
+
+                    # Join these substrings into this code suffixed by the
+                    # substring suffixing all such code (stripping the
+                    # erroneous " and" suffix appended by the last child hint)
+                    # and...
+                    func_curr_code = _join_code_parts(
+                        func_curr_code_parts,
+                        PEP484585_CODE_HINT_TUPLE_FIXED_SUFFIX,
+                        _LINE_RSTRIP_INDEX_AND,
                     ).format(
                         # Indentation deferred above for efficiency.
                         indent_curr=indent_curr,
@@ -1508,7 +1549,7 @@ def make_check_expr(
                     # matching these variable names, we safely (but
                     # inefficiently) format these variables into the exact
                     # strings known to embed them.
-                    func_curr_code = (
+                    func_curr_code_parts = [
                         PEP593_CODE_HINT_VALIDATOR_PREFIX_format(
                             indent_curr=indent_curr,
                             hint_child_placeholder=_enqueue_hint_child(
@@ -1525,7 +1566,7 @@ def make_check_expr(
                                 # arbitrary objects. Ergo, we needn't
                                 # explicitly validate that here.
                                 pith_curr_assign_expr),
-                        ))
+                        )]
 
                     # For each beartype validator annotating this metahint...
                     for hint_child in get_hint_pep593_metadata(hint_curr):
@@ -1550,7 +1591,7 @@ def make_check_expr(
 
                         # Generate and append efficient code type-checking this
                         # validator by embedding this code as is.
-                        func_curr_code += (
+                        func_curr_code_parts.append(
                             PEP593_CODE_HINT_VALIDATOR_CHILD_format(
                                 indent_curr=indent_curr,
                                 # Python expression formatting the current pith
@@ -1571,14 +1612,14 @@ def make_check_expr(
                             mapping_src=hint_child._is_valid_code_locals,
                         )
 
-                    # Munge this code to...
-                    func_curr_code = (
-                        # Strip the erroneous " and" suffix appended by the
-                        # last child hint from this code.
-                        f'{func_curr_code[:_LINE_RSTRIP_INDEX_AND]}'
-                        # Suffix this code by the substring suffixing all such
-                        # code.
-                        f'{PEP593_CODE_HINT_VALIDATOR_SUFFIX_format(indent_curr=indent_curr)}'
+                    # Join these substrings into this code suffixed by the
+                    # substring suffixing all such code (stripping the
+                    # erroneous " and" suffix appended by the last child hint).
+                    func_curr_code = _join_code_parts(
+                        func_curr_code_parts,
+                        PEP593_CODE_HINT_VALIDATOR_SUFFIX_format(
+                            indent_curr=indent_curr),
+                        _LINE_RSTRIP_INDEX_AND,
                     )
                 # Else, this hint is *NOT* a metahint.
                 #
@@ -1687,9 +1728,10 @@ def make_check_expr(
                         hint=hint_curr, exception_prefix=_EXCEPTION_PREFIX)
                     # print(f'Visiting generic type {repr(hint_curr)}...')
 
-                    # Initialize the code type-checking this pith against this
-                    # generic to the substring prefixing all such code.
-                    func_curr_code = PEP484585_CODE_HINT_GENERIC_PREFIX
+                    # Initialize the list of all substrings of the code
+                    # type-checking this pith against this generic to the
+                    # substring prefixing all such code.
+                    func_curr_code_parts = [PEP484585_CODE_HINT_GENERIC_PREFIX]
 
                     # For each unignorable unerased transitive pseudo-superclass
                     # originally declared as a superclass of this generic...
@@ -1702,7 +1744,7 @@ def make_check_expr(
 
                         # Generate and append code type-checking this pith
                         # against this superclass.
-                        func_curr_code += (
+                        func_curr_code_parts.append(
                             PEP484585_CODE_HINT_GENERIC_CHILD_format(
                                 hint_child_placeholder=(_enqueue_hint_child(
                                     # Python expression efficiently reusing the
@@ -1710,15 +1752,14 @@ def make_check_expr(
                                     # a local variable by the prior expression.
                                     pith_curr_var_name))))
 
-                    # Munge this code to...
-                    func_curr_code = (
-                        # Strip the erroneous " and" suffix appended by the
-                        # last child hint from this code.
-                        f'{func_curr_code[:_LINE_RSTRIP_INDEX_AND]}'
-                        # Suffix this code by the substring suffixing all such
-                        # code.
-                        f'{PEP484585_CODE_HINT_GENERIC_SUFFIX}'
-                    # Format...
+                    # Join these substrings into this code suffixed by the
+                    # substring suffixing all such code (stripping the
+                    # erroneous " and" suffix appended by the last child hint)
+                    # and...
+                    func_curr_code = _join_code_parts(
+                        func_curr_code_parts,
+                        PEP484585_CODE_HINT_GENERIC_SUFFIX,
+                        _LINE_RSTRIP_INDEX_AND,
                     ).format(
                         # Indentation deferred above for efficiency.
                         indent_curr=indent_curr,
@@ -1761,9 +1802,10 @@ def make_check_expr(
                         exception_prefix=_EXCEPTION_PREFIX,
                     )
 
-                    # Initialize the code type-checking this pith against this
-                    # hint to the substring prefixing all such code.
-                    func_curr_code = PEP586_CODE_HINT_PREFIX_format(
+                    # Initialize the list of all substrings of the code
+                    # type-checking this pith against this hint to the
+                    # substring prefixing all such code.
+                    func_curr_code_parts = [PEP586_CODE_HINT_PREFIX_format(
                         pith_curr_assign_expr=pith_curr_assign_expr,
 
                         #FIXME: If "typing.Literal" is ever extended to support
@@ -1786,30 +1828,31 @@ def make_check_expr(
                             func_scope=func_wrapper_scope,
                             exception_prefix=_EXCEPTION_PREFIX_HINT,
                         ),
-                    )
+                    )]
 
                     # For each literal object subscripting this hint...
                     for hint_child in hint_childs:
                         # Generate and append efficient code type-checking
                         # this data validator by embedding this code as is.
-                        func_curr_code += PEP586_CODE_HINT_LITERAL_format(
-                            pith_curr_var_name=pith_curr_var_name,
-                            # Python expression evaluating to this object.
-                            hint_child_expr=add_func_scope_attr(
-                                attr=hint_child,
-                                func_scope=func_wrapper_scope,
-                                exception_prefix=(
-                                    _EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
-                            ),
-                        )
+                        func_curr_code_parts.append(
+                            PEP586_CODE_HINT_LITERAL_format(
+                                pith_curr_var_name=pith_curr_var_name,
+                                # Python expression evaluating to this object.
+                                hint_child_expr=add_func_scope_attr(
+                                    attr=hint_child,
+                                    func_scope=func_wrapper_scope,
+                                    exception_prefix=(
+                                        _EXCEPTION_PREFIX_FUNC_WRAPPER_LOCAL),
+                                ),
+                            ))
 
-                    # Munge this code to...
-                    func_curr_code = (
-                        # Strip the erroneous " or" suffix appended by the last
-                        # child hint from this code.
-                        f'{func_curr_code[:_LINE_RSTRIP_INDEX_OR]}'
-                        # Suffix this code by the appropriate substring.
-                        f'{PEP586_CODE_HINT_SUFFIX}'
+                    # Join these substrings into this code suffixed by the
+                    # appropriate substring (stripping the erroneous " or"
+                    # suffix appended by the last child hint).
+                    func_curr_code = _join_code_parts(
+                        func_curr_code_parts,
+                        PEP586_CODE_HINT_SUFFIX,
+                        _LINE_RSTRIP_INDEX_OR,
                     ).format(indent_curr=indent_curr)
                 # Else, this hint is *NOT* a PEP 586-compliant type hint.
 
@@ -1849,10 +1892,10 @@ def make_check_expr(
         #   faster submodule generating PEP-noncompliant code instead.
         elif isinstance(hint_curr, type):
             # Code type-checking the current pith against this type.
-            func_curr_code = PEP484_CODE_HINT_INSTANCE_format(
-                pith_curr_expr=pith_curr_expr,
+            func_curr_code = _make_instance_expr(
+                pith_curr_expr,
                 # Python expression evaluating to this type.
-                hint_curr_expr=add_func_scope_type(
+                add_func_scope_type(
                     cls=hint_curr,
                     func_scope=func_wrapper_scope,
                     exception_prefix=_EXCEPTION_PREFIX_HINT,
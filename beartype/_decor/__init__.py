@@ -140,6 +140,26 @@
 #on-the-fly, we've profiled these builtins to incur substantially higher
 #runtime costs than equivalent "for" loops. Thanks alot, CPython. *sigh*
 
+#FIXME: [SPEED] Consider an opt-in mode (e.g., a new
+#"BeartypeConf.is_mypyc_compile" boolean) compiling the wrapper functions
+#dynamically generated for the hottest decorated callables into C extensions
+#via "mypyc". Doing so is *NOT* trivial, sadly:
+#* "mypyc" is a third-party build-time dependency requiring a C compiler. We
+#  *CANNOT* require either at runtime. This mode would thus need to be an
+#  optional dependency silently ignored when "mypyc" is unimportable.
+#* Wrappers close over hidden "__beartype_"-prefixed default parameters (e.g.,
+#  arbitrary type tuples, the decorated callable itself) that *CANNOT* be
+#  serialized into a standalone module. Each compiled module would instead need
+#  to be injected with that scope at import time, defeating most of the
+#  compile-time optimizations "mypyc" performs on module-scoped globals.
+#* Shelling out to "mypyc" costs seconds per module, which would need to be
+#  deferred to a background thread that then atomically replaces each
+#  pure-Python wrapper. Since callers hold direct references to the original
+#  wrappers, that replacement would need to rebind "__code__" -- which C
+#  extensions lack. *sigh*
+#Ergo, this is best revisited only if a profiled real-world workload shows
+#wrapper call overhead (rather than the decorated callable) dominating.
+
 #FIXME: [FEATURE] Plugin architecture. The NumPy type hints use case will come
 #up again and again. So, let's get out ahead of that use case rather than
 #continuing to reinvent the wheel. Let's begin by defining a trivial plugin API
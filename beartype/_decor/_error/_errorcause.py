@@ -115,7 +115,7 @@ class ViolationCause(object):
           hint of that return), the magic string ``"return"``.
         * Else, :data:`None`.
     random_int : Optional[int]
-        **Pseudo-random integer** (i.e., unsigned 32-bit integer
+        **Pseudo-random integer** (i.e., unsigned 30-bit integer
         pseudo-randomly generated by the parent :func:`beartype.beartype`
         wrapper function in type-checking randomly indexed container items by
         the current call to that function) if that function generated such an
@@ -11,10 +11,13 @@ This private submodule is *not* intended for importation by downstream callers.
 '''
 
 # ....................{ IMPORTS                            }....................
+from beartype._decor._error._util.errorutilcolor import (
+    color_error,
+    color_repr,
+)
 from beartype._util.text.utiltextlabel import (
     label_type,
     prefix_callable_decorated,
-    prefix_callable_decorated_return,
 )
 from beartype._util.text.utiltextrepr import represent_object
 from collections.abc import Callable
@@ -44,9 +47,6 @@ def prefix_callable_decorated_arg_value(
     '''
     assert isinstance(arg_name, str), f'{repr(arg_name)} not string.'
 
-    # Avoid circular import dependencies.
-    from beartype._decor._error._util.errorutilcolor import color_repr
-
     # Human-readable string depicting this parameter name and value.
     arg_name_value = color_repr(f'{arg_name}={represent_object(arg_value)}')
 
@@ -75,12 +75,13 @@ def prefix_callable_decorated_return_value(
         Human-readable label describing this return value.
     '''
 
-    # Avoid circular import dependencies.
-    from beartype._decor._error._util.errorutilcolor import color_repr
-
     # Create and return this label.
+    #
+    # Note that this label intentionally inlines the "return " substring
+    # otherwise appended by the prefix_callable_decorated_return() function,
+    # avoiding an additional function call and intermediate string.
     return (
-        f'{prefix_callable_decorated_return(func)}'
+        f'{prefix_callable_decorated(func)}return '
         f'{color_repr(represent_object(return_value))} '
     )
 
@@ -102,12 +103,6 @@ def represent_pith(pith: object) -> str:
         Human-readable description of this object.
     '''
 
-    # Avoid circular import dependencies.
-    from beartype._decor._error._util.errorutilcolor import (
-        color_error,
-        color_repr,
-    )
-
     # Create and return this representation.
     return (
         f'{color_error(label_type(type(pith)))} '
@@ -65,6 +65,25 @@ This private submodule is *not* intended for importation by downstream callers.
 #  must be taken here to ensure that this exception handling algorithm visits
 #  containers in the exact same order as visited by our testing algorithm.
 
+#FIXME: [SPEED] Consider lazily generating violation messages. Callers that
+#catch and recover from type-checking violations (e.g., to dispatch on type)
+#currently pay the full cost of the get_beartype_violation() function --
+#dominated by representing the offending object and its type hint -- even
+#when that message is never read. To defer that cost:
+#* Define a new "BeartypeConf.is_violation_lazy" boolean option defaulting to
+#  "False".
+#* When enabled, reduce this function to merely instantiating and returning a
+#  violation exception capturing the arguments passed to this function (e.g.,
+#  "func", "conf", "pith_name", "pith_value", "random_int") *WITHOUT* calling
+#  the expensive ViolationCause.find_cause() method.
+#* Override the __str__() dunder method of that exception to generate and
+#  cache that message on the first call.
+#Note that this is non-trivial. Since the "pith_value" object may be mutated
+#between the violation and the first call to __str__(), the resulting message
+#may erroneously describe a now-valid object. Moreover, violation exceptions
+#currently guarantee "args[0]" to be that message; a lazy variant would
+#violate that guarantee and thus break downstream code inspecting "args".
+
 # ....................{ IMPORTS                            }....................
 from beartype.meta import URL_ISSUES
 from beartype.roar._roarexc import (
@@ -194,7 +213,7 @@ def get_beartype_violation(
     pith_value : object
         Passed parameter or returned value violating this hint.
     random_int: Optional[int]
-        **Pseudo-random integer** (i.e., unsigned 32-bit integer
+        **Pseudo-random integer** (i.e., unsigned 30-bit integer
         pseudo-randomly generated by the parent :func:`beartype.beartype`
         wrapper function in type-checking randomly indexed container items by
         the current call to that function) if that function generated such an
@@ -261,6 +280,14 @@ def get_beartype_violation(
     exception_cls: TypeException = None  # type: ignore[assignment]
 
     # Human-readable label describing this parameter or return value.
+    #
+    # Note that this label (including the possibly costly representation of
+    # this pith embedded in this label) is intentionally created eagerly rather
+    # than deferred to a lazy proxy object. Since this label is unconditionally
+    # embedded in the exception message created below, deferring this label
+    # would merely defer rather than avoid that cost. Avoiding that cost
+    # requires deferring the creation of that message as well. See the
+    # "FIXME: [SPEED]" comment above concerning lazy violation messages.
     exception_prefix: str = None  # type: ignore[assignment]
 
     # If the name of this parameter is the magic string implying the passed
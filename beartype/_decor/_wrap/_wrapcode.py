@@ -34,7 +34,15 @@ def make_func_wrapper_code(hint: object, conf: BeartypeConf) -> CodeGenerated:
     PEP-compliant type hint against that hint of the current
     :mod:`beartype`-decorated callable).
 
-    This code factory is memoized for efficiency.
+    This code factory is memoized for efficiency. Since the
+    :func:`beartype._util.cache.utilcachecall.callable_cached` decorator
+    memoizes hashable parameters by equality rather than identity, this
+    factory is already memoized **structurally** (i.e., distinct but equal
+    type hints like ``list[int]`` and ``list[int]`` share the same code).
+    Type hints sharing the same machine-readable representation are
+    additionally deduplicated by the
+    :func:`beartype._check.conv.convcoerce.coerce_hint_any` function *before*
+    being passed to this factory.
 
     Parameters
     ----------
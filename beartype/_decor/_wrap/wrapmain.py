@@ -33,7 +33,10 @@ from beartype.roar import (
     BeartypeDecorHintPepException,
 )
 from beartype.typing import NoReturn
-from beartype._check.checkmagic import ARG_NAME_TYPISTRY
+from beartype._check.checkmagic import (
+    ARG_NAME_TYPISTRY,
+    ARG_NAME_UNPASSED,
+)
 from beartype._check.expr._exprsnip import (
     PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_PREFIX,
     PEP_CODE_HINT_FORWARDREF_UNQUALIFIED_PLACEHOLDER_SUFFIX,
@@ -45,10 +48,12 @@ from beartype._decor._cache.cachetype import (
 )
 from beartype._check.checkcall import BeartypeCall
 from beartype._decor._wrap.wrapsnip import (
+    CODE_HINT_ROOT_PREFIX,
     CODE_INIT_ARGS_LEN,
     CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER,
     CODE_RETURN_CHECK_PREFIX,
     CODE_RETURN_CHECK_SUFFIX,
+    CODE_RETURN_HINT_ROOT_PREFIX,
     CODE_RETURN_UNCHECKED,
     CODE_SIGNATURE,
     PARAM_KIND_TO_CODE_LOCALIZE,
@@ -258,6 +263,27 @@ either may *or* must be passed positionally).
 '''
 
 
+# Parameter kinds whose snippets in the "PARAM_KIND_TO_CODE_LOCALIZE" dictionary
+# localize unpassed parameters to the "ARG_NAME_UNPASSED" sentinel.
+_PARAM_KINDS_UNPASSED_LOCALIZED = frozenset((
+    ArgKind.POSITIONAL_OR_KEYWORD,
+    ArgKind.KEYWORD_ONLY,
+))
+'''
+Frozen set of all **unpassed-localized parameter kinds** (i.e.,
+:attr:`ArgKind` enumeration members signifying that a callable parameter may
+be left unpassed and is thus localized by code comparing that parameter
+against the :data:`ARG_NAME_UNPASSED` sentinel).
+'''
+
+
+_CODE_HINT_ROOT_PREFIX_LEN = len(CODE_HINT_ROOT_PREFIX)
+'''
+Length of the :data:`CODE_HINT_ROOT_PREFIX` snippet prefixing all memoized code
+type-checking parameters and returns, globalized as a negligible optimization.
+'''
+
+
 _RETURN_REPR = repr('return')
 '''
 Object representation of the magic string implying a return value in various
@@ -436,6 +462,13 @@ def _code_check_args(bear_call: BeartypeCall) -> str:
             # Else, this kind of parameter is supported. Ergo, this code is
             # non-"None".
 
+            # If this parameter may be unpassed, expose the sentinel localizing
+            # unpassed parameters to this wrapper function as a hidden default
+            # parameter.
+            if arg_kind in _PARAM_KINDS_UNPASSED_LOCALIZED:
+                bear_call.func_wrapper_scope[ARG_NAME_UNPASSED] = SENTINEL
+            # Else, this parameter is *NOT* unpassable.
+
             # Generate a memoized parameter-agnostic code snippet type-checking
             # any parameter or return value with an arbitrary name.
             (
@@ -607,6 +640,37 @@ def _code_check_return(bear_call: BeartypeCall) -> str:
                         hint_forwardrefs_class_basename),
                 )
 
+                # If this snippet is *NOT* prefixed by the prefix indented for
+                # parameters, raise an exception. Since this snippet is sliced
+                # below by the length of that prefix, silently slicing an
+                # unexpected snippet would generate subtly invalid code.
+                if not code_return_check_pith_unmemoized.startswith(
+                    CODE_HINT_ROOT_PREFIX):
+                    raise BeartypeDecorHintPepException(
+                        f'{EXCEPTION_PLACEHOLDER}code '
+                        f'{repr(code_return_check_pith_unmemoized)} '
+                        f'not prefixed by {repr(CODE_HINT_ROOT_PREFIX)}.'
+                    )
+                # Else, this snippet is prefixed by that prefix.
+
+                # Dedent this snippet to reside directly in the body of the
+                # wrapper function by (in order):
+                # * Replacing the prefix of this snippet indented for
+                #   parameters with that indented for returns.
+                # * Dedenting all subsequent lines of this snippet by one
+                #   indentation level. Although only the first line of this
+                #   snippet is sensitive to indentation, dedenting all lines
+                #   preserves the readability of the wrapper function printed
+                #   when debugging (e.g., "BeartypeConf(is_debug=True)"). Since
+                #   this snippet embeds *NO* multiline string literals (i.e.,
+                #   all embedded objects are represented by single-line
+                #   reprs), this substring replacement is safe.
+                code_return_check_pith_unmemoized = (
+                    CODE_RETURN_HINT_ROOT_PREFIX +
+                    code_return_check_pith_unmemoized[
+                        _CODE_HINT_ROOT_PREFIX_LEN:].replace('\n    ', '\n')
+                )
+
                 # Python code snippet type-checking this return.
                 code_return_check_prefix = CODE_RETURN_CHECK_PREFIX.format(
                     func_call_prefix=bear_call.func_wrapper_code_call_prefix)
@@ -650,7 +714,7 @@ def _unmemoize_func_wrapper_code(
 
     Specifically, this function (in order):
 
-    #. Globally replaces all references to the
+    #. Replaces the only reference to the
        :data:`CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER` placeholder substring
        cached into this code with the passed ``pith_repr`` parameter.
     #. Unmemoizes this code by globally replacing all relative forward
@@ -688,16 +752,38 @@ def _unmemoize_func_wrapper_code(
     assert isinstance(hint_forwardrefs_class_basename, Iterable), (
         f'{repr(hint_forwardrefs_class_basename)} not iterable.')
 
-    # Generate an unmemoized parameter-specific code snippet type-checking this
-    # parameter by replacing in this parameter-agnostic code snippet...
-    func_wrapper_code = replace_str_substrs(
-        text=func_wrapper_code,
-        # This placeholder substring cached into this code with...
-        old=CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER,
-        # This object representation of the name of this parameter or return.
-        new=pith_repr,
+    # Split this parameter-agnostic code snippet on the placeholder substring
+    # cached into this code.
+    #
+    # Note that this placeholder is embedded exactly once into this code by
+    # the "CODE_HINT_ROOT_SUFFIX" snippet suffixing this code. Since that
+    # placeholder thus resides at the end of this code, searching this code
+    # for that placeholder in reverse is substantially more efficient than
+    # either the str.replace() method or replace_str_substrs() function, both
+    # of which exhaustively search this entire code (with the latter searching
+    # this code twice).
+    (
+        func_wrapper_code_prefix,
+        func_wrapper_code_placeholder,
+        func_wrapper_code_suffix,
+    ) = func_wrapper_code.rpartition(CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER)
+    assert func_wrapper_code_placeholder, (
+        f'Placeholder {repr(CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER)} '
+        f'not found in code:\n{func_wrapper_code}'
+    )
+    assert (
+        CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER not in func_wrapper_code_prefix), (
+        f'Placeholder {repr(CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER)} '
+        f'found more than once in code:\n{func_wrapper_code}'
     )
 
+    # Generate an unmemoized parameter-specific code snippet type-checking this
+    # parameter by replacing in this parameter-agnostic code snippet this
+    # placeholder with this object representation of the name of this
+    # parameter or return.
+    func_wrapper_code = (
+        f'{func_wrapper_code_prefix}{pith_repr}{func_wrapper_code_suffix}')
+
     # If this code contains one or more relative forward reference placeholder
     # substrings memoized into this code, unmemoize this code by globally
     # resolving these placeholders relative to the decorated callable.
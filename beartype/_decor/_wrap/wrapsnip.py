@@ -21,6 +21,7 @@ from beartype._check.checkmagic import (
     ARG_NAME_BEARTYPE_CONF,
     ARG_NAME_FUNC,
     ARG_NAME_RAISE_EXCEPTION,
+    ARG_NAME_UNPASSED,
     VAR_NAME_ARGS_LEN,
 )
 from beartype._util.func.arg.utilfuncargiter import ArgKind
@@ -55,11 +56,19 @@ for callables accepting one or more such arguments.
 # ....................{ CODE ~ check                       }....................
 CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER = '?|PITH_ROOT_NAME`^'
 '''
-Placeholder source substring to be globally replaced by the **root pith name**
-(i.e., name of the current parameter if called by the
-:func:`pep_code_check_param` function *or* ``return`` if called by the
-:func:`pep_code_check_return` function) in the parameter- and return-agnostic
-code generated by the memoized :func:`make_func_wrapper_code` function.
+Placeholder source substring to be replaced by the **root pith name** (i.e.,
+name of the current parameter if called by the :func:`pep_code_check_param`
+function *or* ``return`` if called by the :func:`pep_code_check_return`
+function) in the parameter- and return-agnostic code generated by the memoized
+:func:`make_func_wrapper_code` function.
+
+This placeholder is embedded exactly once into that code by the
+:data:`CODE_HINT_ROOT_SUFFIX` snippet suffixing that code. The private
+:func:`beartype._decor._wrap.wrapmain._unmemoize_func_wrapper_code` function
+then replaces that single occurrence by efficiently searching that code in
+reverse via the :meth:`str.rpartition` method rather than globally replacing
+all occurrences via the :meth:`str.replace` method. No other snippet may thus
+embed this placeholder.
 
 See Also
 ----------
@@ -86,6 +95,22 @@ This prefix is intended to be locally suffixed in the
 '''
 
 
+#FIXME: Consider a JIT-friendly alternative to this snippet (e.g., for
+#"torch.compile" and "numba.njit" tracing), raising a builtin "TypeError" with
+#an inline message rather than calling the private get_beartype_violation()
+#function. Note that:
+#* Wrapper functions generated by @beartype already define *NO* closures. All
+#  beartype-specific objects (e.g., "__beartype_func", "__beartype_conf") are
+#  passed as hidden default parameters and thus accessed as fast locals.
+#* Types that are *NOT* builtins *MUST* still be passed as hidden default
+#  parameters. Reducing the wrapper scope to only "__beartype_func" is thus
+#  infeasible for all but the most trivial type hints.
+#* The violation message *CANNOT* be precomputed, as it describes the passed
+#  object that violates the hint. An inline message would thus necessarily be
+#  less informative than the current one.
+#Ergo, this requires a new "BeartypeConf" option selecting this snippet in the
+#make_func_wrapper_code() factory. Let's wait for a concrete request from a JIT
+#user before pursuing this, please.
 CODE_HINT_ROOT_SUFFIX = f''':
             raise {ARG_NAME_RAISE_EXCEPTION}(
                 func={ARG_NAME_FUNC},
@@ -114,6 +139,13 @@ exception.** All other such snippets only test the current pith against the
 current child PEP-compliant type hint and are thus intended to be dynamically
 embedded in the conditional test initiated by the
 :data:`CODE_HINT_ROOT_PREFIX` code snippet.
+
+This string is also the only code snippet permitted to embed the
+:data:`CODE_PITH_ROOT_PARAM_NAME_PLACEHOLDER` placeholder, which *must* occur
+exactly once in the code type-checking each root pith. Embedding that
+placeholder elsewhere trips an assertion in the private
+:func:`beartype._decor._wrap.wrapmain._unmemoize_func_wrapper_code` function,
+which replaces only the last occurrence of that placeholder.
 '''
 
 
@@ -146,31 +178,51 @@ PARAM_KIND_TO_CODE_LOCALIZE = {
     #   parameter from the wrapper's variadic "*kwargs" tuple.
     # * Else, this parameter is unpassed. In this case, localize this parameter
     #   as a placeholder value guaranteed to *NEVER* be passed to any wrapper
-    #   function: the private "__beartypistry" singleton passed to this wrapper
-    #   function as a hidden default parameter and thus accessible here. While
-    #   we could pass a "__beartype_sentinel" parameter to all wrapper
-    #   functions defaulting to "object()" and then use that here instead,
-    #   doing so would slightly reduce efficiency for no tangible gain. *shrug*
+    #   function: the private "beartype._util.utilobject.SENTINEL" object
+    #   passed to this wrapper function as the hidden "__beartype_unpassed"
+    #   default parameter and thus efficiently accessible here as a fast local.
+    #   Note that callers explicitly passing that private object would silently
+    #   bypass type-checking of this parameter. Since that object is reachable
+    #   only by importing private beartype submodules, this is acceptable.
+    #
+    #FIXME: Consider specializing this snippet for the common case in which
+    #this parameter is passed positionally, which would avoid the redundant
+    #"is not" comparison below when "args" is long enough. Note, however, that
+    #this snippet *CANNOT* be reduced to the positional-only snippet above
+    #merely because this parameter "looks" positional (e.g., "self", "cls",
+    #underscore-prefixed names, or callables accepting no "**kwargs"). *ALL*
+    #flexible parameters are passable by keyword. Reducing this snippet on any
+    #such heuristic would silently skip type-checking of parameters that
+    #callers pass by keyword, which is unacceptable. The only sound
+    #specialization is a runtime one, resembling:
+    #    if {VAR_NAME_ARGS_LEN} > {{arg_index}}:
+    #        {VAR_NAME_PITH_ROOT} = args[{{arg_index}}]
+    #        {{code_param_check}}
+    #    elif ...:
+    #That duplicates the type-checking code for each flexible parameter,
+    #doubling the size of the generated wrapper for a savings of a single
+    #identity comparison per call. Until profiling suggests otherwise, the
+    #current snippet remains the sane tradeoff.
     ArgKind.POSITIONAL_OR_KEYWORD: f'''
     # Localize this positional or keyword parameter if passed *OR* to the
-    # sentinel "__beartype_raise_exception" guaranteed to never be passed.
+    # sentinel "{ARG_NAME_UNPASSED}" guaranteed to never be passed.
     {VAR_NAME_PITH_ROOT} = (
         args[{{arg_index}}] if {VAR_NAME_ARGS_LEN} > {{arg_index}} else
-        kwargs.get({{arg_name!r}}, {ARG_NAME_RAISE_EXCEPTION})
+        kwargs.get({{arg_name!r}}, {ARG_NAME_UNPASSED})
     )
 
     # If this parameter was passed...
-    if {VAR_NAME_PITH_ROOT} is not {ARG_NAME_RAISE_EXCEPTION}:''',
+    if {VAR_NAME_PITH_ROOT} is not {ARG_NAME_UNPASSED}:''',
 
     # Snippet localizing any keyword-only parameter (e.g., "*, {kwarg}") by
     # lookup in the wrapper's variadic "**kwargs" dictionary. (See above.)
     ArgKind.KEYWORD_ONLY: f'''
     # Localize this keyword-only parameter if passed *OR* to the sentinel value
-    # "__beartype_raise_exception" guaranteed to never be passed.
-    {VAR_NAME_PITH_ROOT} = kwargs.get({{arg_name!r}}, {ARG_NAME_RAISE_EXCEPTION})
+    # "{ARG_NAME_UNPASSED}" guaranteed to never be passed.
+    {VAR_NAME_PITH_ROOT} = kwargs.get({{arg_name!r}}, {ARG_NAME_UNPASSED})
 
     # If this parameter was passed...
-    if {VAR_NAME_PITH_ROOT} is not {ARG_NAME_RAISE_EXCEPTION}:''',
+    if {VAR_NAME_PITH_ROOT} is not {ARG_NAME_UNPASSED}:''',
 
     # Snippet iteratively localizing all variadic positional parameters.
     ArgKind.VAR_POSITIONAL: f'''
@@ -196,27 +248,39 @@ CODE_RETURN_CHECK_PREFIX = f'''
     # Call this function with all passed parameters and localize the value
     # returned from this call.
     {VAR_NAME_PITH_ROOT} = {{func_call_prefix}}{ARG_NAME_FUNC}(*args, **kwargs)
-
-    # Noop required to artificially increase indentation level. Note that
-    # CPython implicitly optimizes this conditional away. Isn't that nice?
-    if True:'''
+'''
 '''
 PEP-compliant code snippet calling the decorated callable and localizing the
 value returned by that call.
 
-Note that this snippet intentionally terminates on a noop increasing the
-indentation level, enabling subsequent type-checking code to effectively ignore
-indentation level and thus uniformly operate on both:
+Note that this snippet is intended to be suffixed by code type-checking this
+return value prefixed by the :data:`CODE_RETURN_HINT_ROOT_PREFIX` snippet
+rather than the :data:`CODE_HINT_ROOT_PREFIX` snippet prefixing code
+type-checking parameters. Whereas the latter is indented to reside inside the
+block localizing each parameter (e.g., ``if {pith} is not
+__beartype_unpassed:``), the former is indented to reside directly in the
+body of the wrapper function. Since *only* the first line of that code is
+sensitive to indentation (with all subsequent lines either residing inside
+parentheses *or* residing inside the block opened by that line), swapping
+these prefixes suffices to generate valid code. All subsequent lines are
+nonetheless dedented as well, preserving the readability of wrapper functions
+printed when debugging.
+
+This approach supersedes a prior approach in which this snippet terminated on
+a noop ``if True:`` conditional artificially increasing the indentation level.
+Although CPython reduces that conditional to a ``NOP`` instruction, that
+instruction is still executed on each call to the wrapper function.
+'''
 
-* Parameters localized via values of the
-  :data:`PARAM_KIND_TO_PEP_CODE_LOCALIZE` dictionary.
-* Return values localized via this snippet.
 
-See Also
-----------
-https://stackoverflow.com/a/18124151/2809027
-    Bytecode disassembly demonstrating that CPython optimizes away the spurious
-   ``if True:`` conditional hardcoded into this snippet.
+CODE_RETURN_HINT_ROOT_PREFIX = '''
+    # Type-check this return value against this PEP-compliant type hint.
+    if not '''
+'''
+PEP-compliant code snippet prefixing all code type-checking the return value
+of the decorated callable against the root PEP-compliant type hint annotating
+that return, replacing the :data:`CODE_HINT_ROOT_PREFIX` snippet memoized into
+that code.
 '''
 
 
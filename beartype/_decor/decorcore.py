@@ -691,6 +691,14 @@ def _beartype_func(
     # attributes take precedence over global attributes, implying all global
     # attributes are *ALWAYS* first looked up as local attributes before falling
     # back to being looked up as global attributes.
+    #
+    # Note that this wrapper scope is consumed exactly once: the "def" statement
+    # executed by make_func() evaluates the defaults of all hidden keyword-only
+    # "__beartype_"-prefixed parameters declared by this wrapper into the
+    # "__kwdefaults__" dictionary of this wrapper. No call to this wrapper ever
+    # rebuilds that dictionary. Moreover, that dictionary *CANNOT* be shared
+    # between wrappers, as the values of these parameters (e.g., the decorated
+    # callable) typically differ between wrappers even for the same code.
     func_wrapper = make_func(
         func_name=bear_call.func_wrapper_name,
         func_code=func_wrapper_code,
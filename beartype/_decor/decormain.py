@@ -80,6 +80,14 @@ if (
 #         return
 #
 # Tragically, Python fails to support module-scoped "return" statements. *sigh*
+#
+# Note that wrapper functions dynamically generated by @beartype intentionally
+# do *NOT* embed "if __debug__:" blocks guarding their type-checking code. Since
+# the "-O" option (and equivalently the ${PYTHONOPTIMIZE} environment variable)
+# is only ever parsed once at interpreter startup, no wrapper function is ever
+# generated under an optimized interpreter: this identity decorator is used
+# instead, which costs nothing at call time. Embedding such blocks would thus
+# only increase the size of every generated wrapper for no tangible gain.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 # CAUTION: Synchronize the signature of this identity decorator with the
 # non-identity decorator imported below.
@@ -167,6 +167,62 @@ class CacheLruStrong(dict):
             raise KeyError(f'Key Error: {key}')
 
 
+    def get(
+        self,
+        key: Hashable,
+        default: object = None,
+
+        # Superclass methods efficiently localized as default parameters.
+        __contains=dict.__contains__,
+        __getitem=dict.__getitem__,
+        __delitem=dict.__delitem__,
+        __pushitem=dict.__setitem__,
+    ) -> object:
+        '''
+        Return an item previously cached under the passed key *or* the passed
+        default value otherwise.
+
+        This implementation is *practically* identical to
+        :meth:`self.__getitem__` except we return this default value rather
+        than raising a :exc:`KeyError` exception. Since the message of that
+        exception embeds the representation of this key, callers expecting
+        frequent cache misses should prefer this method. Doing so avoids both
+        the cost of representing this key *and* any exception raised by a
+        poorly implemented ``__repr__()`` dunder method of this key.
+
+        Parameters
+        ----------
+        key : Hashable
+            Arbitrary hashable key to retrieve the cached value of.
+        default : object
+            Arbitrary value to be returned if this key isn't cached. Defaults
+            to ``None``.
+
+        Returns
+        ----------
+        object
+            Either:
+
+            * If this key is cached, the arbitrary value cached under this key.
+            * Else, this default value.
+
+        Raises
+        ----------
+        TypeError
+            If this key is not hashable.
+        '''
+
+        with self._lock:
+            # Reset this key if it exists.
+            if __contains(self, key):
+                val = __getitem(self, key)
+                __delitem(self, key)
+                __pushitem(self, key, val)
+                return val
+
+            return default
+
+
     def __setitem__(
         self,
         key: Hashable,
@@ -17,16 +17,43 @@ from beartype.roar._roarexc import _BeartypeUtilCallableException
 from beartype.typing import (
     Optional,
     Type,
+    cast,
 )
 from beartype._data.datatyping import LexicalScope
+from beartype._util.cache.map.utilmaplru import CacheLruStrong
+from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_8
 from beartype._util.text.utiltextlabel import label_exception
 from beartype._util.text.utiltextmunge import number_lines
 from beartype._util.utilobject import get_object_name
 from collections.abc import Callable
 from functools import update_wrapper
 from linecache import cache as linecache_cache  # type: ignore[attr-defined]
+from types import CodeType
 from weakref import finalize
 
+# ....................{ PRIVATE ~ globals                  }....................
+_FUNC_CODE_TO_CODE_COMPILED = CacheLruStrong(size=4096)
+'''
+**Compiled code cache** (i.e., thread-safe LRU cache mapping from the
+stripped code snippet passed to each prior call to the :func:`make_func`
+factory to the code object compiled by the :func:`compile` builtin from that
+snippet).
+
+This cache enables repeated calls to that factory passed the same code snippet
+(e.g., :func:`beartype.beartype`-decorated methods sharing the same name and
+type hints across a large codebase) to reuse the previously compiled code
+object rather than recompiling that snippet. The :func:`compile` builtin is one
+of the most expensive steps in the decoration of any callable.
+
+Caveats
+----------
+**This cache is only safely usable under Python >= 3.8.** Each compiled code
+object embeds the fake filename uniquely synthesized for that callable by the
+:func:`make_func` factory. Since the :meth:`types.CodeType.replace` method
+required to replace that filename when reusing a cached code object is only
+available under Python >= 3.8, this cache is ignored under Python 3.7.
+'''
+
 # ....................{ MAKERS                             }....................
 def make_func(
     # Mandatory arguments.
@@ -234,7 +261,26 @@ def make_func(
         # willing to constrain the passed "func_code" to a single statement. In
         # casual testing, there is very little performance difference between
         # the two (with an imperceptibly slight edge going to "single").
-        func_code_compiled = compile(func_code, func_filename, 'exec')
+        #
+        # If this function is *NOT* being debugged *AND* the active Python
+        # interpreter targets Python >= 3.8, attempt to reuse the code object
+        # previously compiled from the same code snippet if any.
+        func_code_compiled: CodeType
+        if not is_debug and IS_PYTHON_AT_LEAST_3_8:
+            # Attempt to reuse that code object.
+            try:
+                func_code_compiled = cast(
+                    CodeType, _FUNC_CODE_TO_CODE_COMPILED[func_code])
+            # If that code object has yet to be compiled, compile and cache
+            # that code object for subsequent reuse.
+            except KeyError:
+                func_code_compiled = _FUNC_CODE_TO_CODE_COMPILED[func_code] = (
+                    compile(func_code, func_filename, 'exec'))
+        # Else, this function is either being debugged *OR* the active Python
+        # interpreter targets Python 3.7. In either case, unconditionally
+        # compile that code object.
+        else:
+            func_code_compiled = compile(func_code, func_filename, 'exec')
         assert func_name not in func_locals
 
         # Define that function. For obscure and likely uninteresting reasons,
@@ -286,6 +332,15 @@ def make_func(
         update_wrapper(wrapper=func, wrapped=func_wrapped)
     # Else, that function is *NOT* such a wrapper.
 
+    # If that function was declared by a code object reused from a prior call
+    # to this factory, that function's filename is that of the function created
+    # by that prior call. In this case, replace that filename with the fake
+    # filename uniquely synthesized above for that function.
+    if func.__code__.co_filename != func_filename:  # type: ignore[attr-defined]
+        func.__code__ = func.__code__.replace(  # type: ignore[attr-defined]
+            co_filename=func_filename)
+    # Else, that function's filename is already the expected filename.
+
     # ..................{ CLEANUP                            }..................
     # If that function is documented...
     #
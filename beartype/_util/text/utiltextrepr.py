@@ -66,6 +66,20 @@ to these representations either being effectively quoted already *or*
 sufficiently terse as to not benefit from being quoted).
 '''
 
+
+_TYPES_SEQUENCE_SLICEABLE = frozenset((list, tuple))
+'''
+Frozen set of all **sliceable builtin sequence types** (i.e., builtin types
+whose machine-readable representations are simply the comma-delimited
+representations of their items bracketed by punctuation, enabling the
+:func:`represent_object` function to efficiently represent the leading items
+of large instances of these types by representing shallow slices of only those
+items).
+
+Note that subclasses of these types are intentionally excluded, as these
+subclasses may override the :meth:`object.__repr__` dunder method.
+'''
+
 # ....................{ REPRESENTERS                       }....................
 def represent_object(
     # Mandatory parameters.
@@ -152,6 +166,38 @@ def represent_object(
     #See also:
     #   https://github.com/celery/celery/blob/master/celery/utils/saferepr.py
 
+    # If this object is a builtin sequence whose representation would
+    # necessarily exceed this maximum length, reduce this object to a shallow
+    # slice of only its leading items *BEFORE* representing this object.
+    # Representing a large sequence (e.g., a list of 100 million items) is
+    # linear in the number of items and thus unacceptably slow, despite this
+    # representation then being truncated to this maximum length below.
+    #
+    # Why "max_len // 2 + 2" items? Because the representation of each item is
+    # delimited from the next by the 2-character substring ", ". Ergo, the
+    # representation of this many leading items of a non-recursive sequence is
+    # guaranteed to share a prefix longer than this maximum length with the
+    # representation of that full sequence -- guaranteeing the truncated
+    # representation returned below to be identical for both.
+    #
+    # Recursive sequences are the exception. The repr() builtin represents a
+    # sequence directly containing itself as "[...]", which a shallow slice
+    # no longer is. This representer thus avoids slicing sequences whose
+    # leading items include that sequence itself. Sequences only indirectly
+    # containing themselves (e.g., "muh_list[0] = [muh_list]") are still
+    # sliced, in which case the truncated representation returned below
+    # expands one additional level of recursion before eliding that recursion
+    # as "[...]" -- a harmless cosmetic discrepancy.
+    if obj.__class__ in _TYPES_SEQUENCE_SLICEABLE:
+        obj_items_len_max = max_len // 2 + 2
+        if len(obj) > obj_items_len_max:  # type: ignore[arg-type]
+            obj_items = obj[:obj_items_len_max]  # type: ignore[index]
+            if not any(obj_item is obj for obj_item in obj_items):
+                obj = obj_items
+            # Else, this sequence directly contains itself. Preserve this
+            # sequence as is.
+    # Else, this object is *NOT* a large builtin sequence.
+
     # String describing this object. Note that:
     # * This representation quote-protects all newlines in this representation.
     #   Ergo, "\n" *MUST* be matched as r"\n" instead below.
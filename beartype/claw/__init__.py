@@ -12,8 +12,6 @@ packages and modules with runtime type-checking dynamically generated by the
 :func:`beartype.beartype` decorator in a single line of code.
 '''
 
-# ....................{ TODO                               }....................
-
 # ....................{ IMPORTS                            }....................
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 # WARNING: To avoid polluting the public module namespace, external attributes
@@ -21,6 +19,17 @@ packages and modules with runtime type-checking dynamically generated by the
 # names (e.g., "from argparse import ArgumentParser as _ArgumentParser" rather
 # than merely "from argparse import ArgumentParser").
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+# Note that these attributes are intentionally imported eagerly rather than
+# lazily via a PEP 562-compliant module __getattr__() dunder function. Why?
+# Because the root "beartype" package never imports this subpackage. Callers
+# only pay for these import hooks by explicitly importing this subpackage, in
+# which case they almost certainly intend to call these hooks. Moreover, these
+# hooks import little beyond the stdlib "ast" module; profiling shows these
+# hooks to consume less than 1ms of the ~45ms required to import this
+# subpackage, nearly all of which is consumed by importing "beartype" itself.
+# Lazy exports would thus only obscure these attributes from static type
+# checkers and IDEs for *NO* tangible gain.
 from beartype.claw._clawpathhooks import (
     beartype_all,
     beartype_package,
@@ -46,6 +46,13 @@ def test_lrucachestrong_one_pass() -> None:
     assert len(lru_cache) == 1
     assert lru_cache[LRU_CACHE_KEY_A] == LRU_CACHE_VALUE_A
 
+    # Confirm get() returns this value for this key and the passed default
+    # value for an uncached key.
+    assert lru_cache.get(LRU_CACHE_KEY_A) == LRU_CACHE_VALUE_A
+    assert lru_cache.get(LRU_CACHE_KEY_B) is None
+    assert lru_cache.get(LRU_CACHE_KEY_B, LRU_CACHE_VALUE_B) == (
+        LRU_CACHE_VALUE_B)
+
     # Test the implicit enforcement of cache size
     lru_cache[LRU_CACHE_KEY_B] = LRU_CACHE_VALUE_B
     assert len(lru_cache) == 1
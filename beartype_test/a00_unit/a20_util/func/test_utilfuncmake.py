@@ -214,6 +214,62 @@ def to_strive_to_seek_to_find(and_not_to_yield: str) -> str:
     assert 'return and_not_to_yield' in func_cache_code
 
 
+def test_make_func_code_cached() -> None:
+    '''
+    Test that the :func:`beartype._util.func.utilfuncmake.make_func` function
+    reuses code objects compiled from the same code snippet under Python >=
+    3.8 while preserving the unique filenames of the functions created by that
+    function.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.func.utilfuncmake import (
+        _FUNC_CODE_TO_CODE_COMPILED,
+        make_func,
+    )
+    from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_8
+
+    # Arbitrary code snippet shared between the functions created below.
+    YET_ALL_EXPERIENCE_IS_AN_ARCH = '''
+def wherethro_gleams_that_untravelld_world(whose_margin: str) -> str:
+    return whose_margin
+'''
+
+    # Arbitrary callables wrapped by the wrappers created below.
+    def how_dull_it_is_to_pause() -> str:
+        return 'to make an end,'
+    def to_rust_unburnishd() -> str:
+        return 'not to shine in use!'
+
+    # Two wrappers declared by the same code snippet wrapping these callables.
+    as_tho_to_breathe = make_func(
+        func_name='wherethro_gleams_that_untravelld_world',
+        func_code=YET_ALL_EXPERIENCE_IS_AN_ARCH,
+        func_wrapped=how_dull_it_is_to_pause,
+    )
+    were_life = make_func(
+        func_name='wherethro_gleams_that_untravelld_world',
+        func_code=YET_ALL_EXPERIENCE_IS_AN_ARCH,
+        func_wrapped=to_rust_unburnishd,
+    )
+
+    # Assert these wrappers behave as expected.
+    assert as_tho_to_breathe('fades for ever') == 'fades for ever'
+    assert were_life('and for ever') == 'and for ever'
+
+    # Assert these wrappers preserve their unique filenames.
+    assert (
+        as_tho_to_breathe.__code__.co_filename !=
+        were_life.__code__.co_filename
+    )
+
+    # If the active Python interpreter targets Python >= 3.8, assert the code
+    # object compiled from this code snippet was cached for subsequent reuse.
+    if IS_PYTHON_AT_LEAST_3_8:
+        assert YET_ALL_EXPERIENCE_IS_AN_ARCH.strip() in (
+            _FUNC_CODE_TO_CODE_COMPILED)
+
+
 def test_make_func_fail() -> None:
     '''
     Test unsuccessful usage of the
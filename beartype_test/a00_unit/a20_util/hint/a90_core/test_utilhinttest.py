@@ -16,6 +16,18 @@ This submodule unit tests the public API of the private
 # package-specific submodules at module scope.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
+# Note that the type hint data deferred-imported by tests below (e.g.,
+# "HINTS_NONPEP", "HINTS_PEP_META") are already frozen sets and tuples created
+# exactly once by the first importation of their data submodules. Subsequent
+# deferred imports of these data merely look up these submodules in the
+# "sys.modules" cache and thus incur *NO* meaningful setup costs.
+#
+# Note that tests below intentionally iterate over these data rather than
+# being parametrized over these data via the "@pytest.mark.parametrize"
+# decorator. The latter would require importing these data at module scope and
+# thus at pytest test collection time, violating the above warning. Moreover,
+# pytest's assertion rewriting already reports the offending hint on failure.
+
 # ....................{ TESTS                              }....................
 def test_die_unless_hint() -> None:
     '''
@@ -27,6 +27,8 @@ def test_label_type() -> None:
     # Defer test-specific imports.
     from beartype._util.text.utiltextlabel import label_type
     from beartype_test.a00_unit.data.data_type import Class
+    from collections.abc import Hashable
+    from contextlib import AbstractContextManager
 
     # Assert this labeller returns the expected label for a builtin type.
     assert label_type(str) == 'str'
@@ -39,6 +41,31 @@ def test_label_type() -> None:
     assert label_type(Class) == (
         '<class "beartype_test.a00_unit.data.data_type.Class">')
 
+    # Assert this labeller returns the same label when relabelling the same
+    # user-defined type, implying this label to have been cached.
+    assert label_type(Class) is label_type(Class)
+
+    # Assert this labeller returns the expected labels for standard abstract
+    # base classes (ABCs) supporting structural subtyping.
+    assert label_type(Hashable) == '<protocol ABC "collections.abc.Hashable">'
+    assert label_type(AbstractContextManager) == (
+        '<protocol ABC "contextlib.AbstractContextManager">')
+
+    # Metaclass whose representer unconditionally raises an exception.
+    class ThatColossalWreck(type):
+        def __repr__(cls) -> str:
+            raise ValueError('Round the decay of that colossal wreck')
+
+    # Class whose metaclass is that metaclass.
+    class BoundlessAndBare(object, metaclass=ThatColossalWreck):
+        pass
+
+    # Assert this labeller labels this class without representing this class.
+    assert label_type(BoundlessAndBare) == (
+        f'<class "{BoundlessAndBare.__module__}.'
+        f'{BoundlessAndBare.__name__}">'
+    )
+
 # ....................{ TESTS ~ prefixers                  }....................
 def test_prefix_callable() -> None:
     '''
@@ -93,3 +120,44 @@ def test_prefix_callable() -> None:
     assert isinstance(sync_generator_label, str)
     assert sync_generator_factory.__name__ in sync_generator_label
     assert 'generator' in sync_generator_label
+
+
+def test_prefix_callable_decorated() -> None:
+    '''
+    Test the
+    :func:`beartype._util.text.utiltextlabel.prefix_callable_decorated`
+    function.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.text.utiltextlabel import (
+        prefix_callable_decorated,
+        prefix_callable_decorated_arg,
+        prefix_callable_decorated_pith,
+        prefix_callable_decorated_return,
+    )
+    from beartype_test.a00_unit.data.util.mod.data_utilmodule_line import (
+        like_snakes_that_watch_their_prey)
+
+    # Assert this labeller labels an on-disk non-lambda callable as expected.
+    stamped_on_these_lifeless_things = prefix_callable_decorated(
+        like_snakes_that_watch_their_prey)
+    assert isinstance(stamped_on_these_lifeless_things, str)
+    assert stamped_on_these_lifeless_things.startswith('@beartyped ')
+    assert like_snakes_that_watch_their_prey.__name__ in (
+        stamped_on_these_lifeless_things)
+
+    # Assert this labeller returns the same label when relabelling the same
+    # callable, implying this label to have been cached.
+    assert prefix_callable_decorated(like_snakes_that_watch_their_prey) is (
+        stamped_on_these_lifeless_things)
+
+    # Assert this labeller labels parameters and returns of this callable
+    # identically to the lower-level labellers specific to each.
+    assert prefix_callable_decorated_pith(
+        like_snakes_that_watch_their_prey, 'return') == (
+        prefix_callable_decorated_return(like_snakes_that_watch_their_prey))
+    assert prefix_callable_decorated_pith(
+        like_snakes_that_watch_their_prey, 'the_lone_and_level_sands') == (
+        prefix_callable_decorated_arg(
+            like_snakes_that_watch_their_prey, 'the_lone_and_level_sands'))
@@ -80,3 +80,25 @@ def test_represent_object():
     like_a_star_of_heaven = represent_object(
         obj='In the golden lightning\nOf the sunken sun,', max_len=2)
     assert len(like_a_star_of_heaven) == 2
+
+    # Large builtin sequences whose representations exceed the default maximum
+    # length by several orders of magnitude.
+    IN_THE_BROAD_DAYLIGHT = list(range(100000))
+    THOU_ART_UNSEEN = tuple(str(item) for item in range(100000))
+
+    # Assert this representer represents these sequences by truncating the
+    # representations of these full sequences to the default maximum length.
+    for large_sequence in (IN_THE_BROAD_DAYLIGHT, THOU_ART_UNSEEN):
+        large_sequence_repr = represent_object(large_sequence)
+        assert len(large_sequence_repr) == 96
+        assert large_sequence_repr.startswith(repr(large_sequence)[:92])
+
+    # Large builtin sequence directly containing itself.
+    LIKE_A_POET_HIDDEN = [None] * 100000
+    LIKE_A_POET_HIDDEN[0] = LIKE_A_POET_HIDDEN
+
+    # Assert this representer represents this sequence by truncating the
+    # representation of this full sequence, which elides this recursion.
+    recursive_sequence_repr = represent_object(LIKE_A_POET_HIDDEN)
+    assert recursive_sequence_repr.startswith('[[...], None, ')
+    assert recursive_sequence_repr.startswith(repr(LIKE_A_POET_HIDDEN)[:92])
@@ -33,3 +33,127 @@ def test_make_check_code_decoration() -> None:
         make_check_expr(str, BEARTYPE_CONF_DEFAULT) is
         make_check_expr(str, BEARTYPE_CONF_DEFAULT)
     )
+
+
+def test_make_check_code_structural() -> None:
+    '''
+    Test the :func:`beartype._check.expr.exprmake.make_check_expr` function
+    generates identical code for structurally equal but distinct hints.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._check.expr.exprmake import make_check_expr
+    from beartype._conf.confcls import BEARTYPE_CONF_DEFAULT
+    from beartype.typing import Dict
+
+    # Two structurally equal hints that are possibly distinct objects.
+    hint_a = Dict[bytes, complex]
+    hint_b = Dict[bytes, complex]
+    assert hint_a == hint_b
+
+    # Assert this function memoizes these hints by equality rather than
+    # identity and thus generates identical code for these hints.
+    assert (
+        make_check_expr(hint_a, BEARTYPE_CONF_DEFAULT) is
+        make_check_expr(hint_b, BEARTYPE_CONF_DEFAULT)
+    )
+
+
+def test_make_check_code_union_nonpep() -> None:
+    '''
+    Test the :func:`beartype._check.expr.exprmake.make_check_expr` function
+    generates a single :func:`isinstance` call type-checking all
+    PEP-noncompliant child types subscripting a union against a tuple of these
+    types.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._check.expr.exprmake import make_check_expr
+    from beartype._conf.confcls import BEARTYPE_CONF_DEFAULT
+    from beartype.typing import (
+        List,
+        Union,
+    )
+
+    # Code and local scope type-checking a union of only PEP-noncompliant
+    # child types.
+    func_code, func_scope, _ = make_check_expr(
+        Union[int, str, float], BEARTYPE_CONF_DEFAULT)
+
+    # Assert this code type-checks these types with a single isinstance() call
+    # passed a tuple of these types.
+    assert func_code.count('isinstance(') == 1
+    assert any(
+        isinstance(scope_value, tuple) and
+        set(scope_value) == {int, str, float}
+        for scope_value in func_scope.values()
+    )
+
+    # Code type-checking a union of both PEP-noncompliant and -compliant child
+    # types.
+    func_code, func_scope, _ = make_check_expr(
+        Union[int, str, List[complex]], BEARTYPE_CONF_DEFAULT)
+
+    # Assert this code type-checks these PEP-noncompliant types with a single
+    # isinstance() call *BEFORE* type-checking the PEP-compliant type.
+    assert func_code.count('isinstance(') == 3
+    assert any(
+        isinstance(scope_value, tuple) and
+        set(scope_value) == {int, str}
+        for scope_value in func_scope.values()
+    )
+
+
+def test_make_check_code_sequence_union_nonpep() -> None:
+    '''
+    Test the :func:`beartype._check.expr.exprmake.make_check_expr` function
+    generates a single :func:`isinstance` call type-checking a random item of a
+    sequence against a tuple of all PEP-noncompliant child types subscripting a
+    union subscripting that sequence.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._check.expr.exprmake import make_check_expr
+    from beartype._conf.confcls import BEARTYPE_CONF_DEFAULT
+    from beartype.typing import (
+        List,
+        Union,
+    )
+
+    # Code and local scope type-checking a sequence of a union of only
+    # PEP-noncompliant child types.
+    func_code, func_scope, _ = make_check_expr(
+        List[Union[bytes, complex]], BEARTYPE_CONF_DEFAULT)
+
+    # Assert this code type-checks this sequence with one isinstance() call and
+    # a random item of this sequence with one isinstance() call passed a tuple
+    # of these types accessible as a hidden parameter of the wrapper.
+    assert func_code.count('isinstance(') == 2
+    assert any(
+        isinstance(scope_value, tuple) and
+        set(scope_value) == {bytes, complex}
+        for scope_value in func_scope.values()
+    )
+
+
+def test_make_check_code_union_none() -> None:
+    '''
+    Test the :func:`beartype._check.expr.exprmake.make_check_expr` function
+    generates an identity test rather than an :func:`isinstance` call
+    type-checking the :data:`None` singleton subscripting a union.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._check.expr.exprmake import make_check_expr
+    from beartype._conf.confcls import BEARTYPE_CONF_DEFAULT
+    from beartype.typing import Optional
+
+    # Code and local scope type-checking an optional PEP-noncompliant type.
+    func_code, func_scope, _ = make_check_expr(
+        Optional[complex], BEARTYPE_CONF_DEFAULT)
+
+    # Assert this code type-checks "None" via an identity test *AND* this type
+    # via a single isinstance() call passed only this type.
+    assert ') is None or' in func_code
+    assert func_code.count('isinstance(') == 1
+    assert type(None) not in func_scope.values()
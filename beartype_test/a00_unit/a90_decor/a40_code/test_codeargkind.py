@@ -86,6 +86,42 @@ def test_arg_kind_flex_varkw() -> None:
         'the teeth tearing into it',
     ))
 
+
+def test_arg_kind_flex_unpassed() -> None:
+    '''
+    Test the :func:`beartype.beartype` decorator on a callable passed a
+    flexible parameter and a keyword-only parameter whose values are private
+    :mod:`beartype` objects previously reused as the sentinel signifying
+    unpassed parameters by wrappers generated by that decorator.
+
+    This test guards against regressions in which wrappers silently failed to
+    type-check parameters passed those objects.
+    '''
+
+    # Defer test-specific imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintViolation
+    from beartype._decor._error.errormain import get_beartype_violation
+    from beartype_test._util.pytroar import raises_uncached
+
+    # Decorated callable to be exercised.
+    @beartype
+    def and_then_he_said(
+        it_is_a_plan: str = 'so long,',
+        *,
+        i_have_been_given: str = 'the plan is for me to go away',
+    ) -> str:
+        return it_is_a_plan + i_have_been_given
+
+    # Assert that calling this callable with these objects passed either
+    # positionally or by keyword raises the expected exception.
+    with raises_uncached(BeartypeCallHintViolation):
+        and_then_he_said(get_beartype_violation)
+    with raises_uncached(BeartypeCallHintViolation):
+        and_then_he_said(it_is_a_plan=get_beartype_violation)
+    with raises_uncached(BeartypeCallHintViolation):
+        and_then_he_said(i_have_been_given=get_beartype_violation)
+
 # ....................{ TESTS ~ pep 3102                  }....................
 # Keyword-only keywords require PEP 3102 compliance, which has thankfully been
 # available since Python >= 3.0.
@@ -194,3 +194,41 @@ def test_decor_noop_hint_ignorable_order() -> None:
         'Goff Klawstompa: Mega-Gargant')
     assert mork_typed('Killa Kan', "Big Mek's Stompa: ") == (
         "Big Mek's Stompa: Killa Kan")
+
+
+def test_decor_noop_hint_ignorable_mixed() -> None:
+    '''
+    Test that the :func:`beartype.beartype` decorator generates *no*
+    type-checking code for parameters and returns annotated by ignorable type
+    hints of callables also annotated by one or more unignorable type hints.
+    '''
+
+    # Defer test-specific imports.
+    from beartype import beartype
+    from beartype.roar import BeartypeCallHintParamViolation
+    from pytest import raises
+    from typing import Any
+
+    # Undecorated annotated function with both ignorable and unignorable type
+    # hints.
+    def ghazghkull(waaagh: Any, thraka: int, prophet: object) -> Any:
+        return waaagh
+
+    # Decorated annotated function with both ignorable and unignorable type
+    # hints.
+    ghazghkull_typed = beartype(ghazghkull)
+
+    # Assert that @beartype generated a new wrapper type-checking this
+    # unignorable type hint.
+    assert ghazghkull_typed is not ghazghkull
+
+    # Assert this wrapper silently accepts arbitrary objects for parameters
+    # annotated by ignorable type hints.
+    assert ghazghkull_typed(
+        'Beast of Armageddon', 0xDEADBEEF, prophet=b'Gork and Mork') == (
+        'Beast of Armageddon')
+
+    # Assert this wrapper raises the expected exception when passed an object
+    # violating this unignorable type hint.
+    with raises(BeartypeCallHintParamViolation):
+        ghazghkull_typed('Great Waaagh', 'Thraka', None)